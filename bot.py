@@ -1,11 +1,11 @@
 import os
 import asyncio
+import importlib
 from datetime import datetime
 
 from dotenv import load_dotenv
 from loguru import logger
 
-from pipecat.audio.vad.silero import SileroVADAnalyzer
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.runner import PipelineRunner
 from pipecat.pipeline.task import PipelineParams, PipelineTask
@@ -17,86 +17,92 @@ from pipecat.runner.types import (
     WebSocketRunnerArguments,
 )
 from pipecatcloud.agent import DailySessionArguments
-from pipecat.runner.utils import parse_telephony_websocket
-from pipecat.serializers.twilio import TwilioFrameSerializer
-from pipecat.services.cartesia.tts import CartesiaTTSService
-from pipecat.services.deepgram.stt import DeepgramSTTService
-from pipecat.services.openai.llm import OpenAILLMService
 from pipecat.services.llm_service import FunctionCallParams
 from pipecat.transports.base_transport import BaseTransport, TransportParams
-from pipecat.transports.websocket.fastapi import (
-    FastAPIWebsocketParams,
-    FastAPIWebsocketTransport,
-)
-from pipecat.transports.smallwebrtc.transport import SmallWebRTCTransport
 from pipecat.services.gemini_multimodal_live.gemini import GeminiMultimodalLiveLLMService
 
+from vad import GatedSileroVADAnalyzer, load_silero_model
+
 # Load environment variables (API keys, Twilio, etc.)
 load_dotenv(override=True)
 
+# Read configuration once; a missing Gemini key fails at startup, not on the first call
+_GOOGLE_API_KEY = os.environ["GOOGLE_API_KEY"]
+_TWILIO_ACCOUNT_SID = os.getenv("TWILIO_ACCOUNT_SID", "")
+_TWILIO_AUTH_TOKEN = os.getenv("TWILIO_AUTH_TOKEN", "")
+# Metrics and RTVI observers add per-frame work; opt in with PIPECAT_METRICS=1
+_ENABLE_METRICS = os.getenv("PIPECAT_METRICS", "0") == "1"
+
+# Load the shared Silero VAD model now so no call pays for it on the event loop
+load_silero_model()
+
+
+# Prompt: static system role, kept identical across calls so it can be prefix-cached
+SYSTEM_PROMPT = "You are a receptionist for a Dubai based RESTAURANT called The Salusbury. You are on a phone call and therefore the users inputs are coming from a transcription model so take that into account. Respond naturally, concisely and keep your answers conversational as these will be spoken by a text to speech model. Your goal is to take the users request and to try to help them as best you can. Before using check_availability, ensure the user has provided a valid date and time and party size and also let them know that you will check availability and then call the function."
+
+# Tool: function the LLM can call to check availability
+TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "check_availability",
+            "description": "Check table availability. Always returns that a table is available.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "date": {
+                        "type": "string",
+                        "description": "Desired date (YYYY-MM-DD)",
+                    },
+                    "time": {
+                        "type": "string",
+                        "description": "Desired time (HH:MM, 24h)",
+                    },
+                    "party_size": {
+                        "type": "integer",
+                        "description": "Number of guests",
+                    },
+                },
+                "required": ["date", "time", "party_size"],
+            },
+        },
+    }
+]
+
 
 async def run_bot(transport: BaseTransport):
     logger.info(f"Starting bot")
 
     # LLM: generate responses and call tools (Cerebras)
     llm = GeminiMultimodalLiveLLMService(
-        api_key=os.getenv("GOOGLE_API_KEY"),
+        api_key=_GOOGLE_API_KEY,
         model_id="gemini-live-2.5-flash-preview-native-audio",
         voice_id="Puck",  # Aoede, Charon, Fenrir, Kore, Puck
     )
 
     # Prompt: set system role and current time context
-    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    now = datetime.now().isoformat(sep=" ", timespec="seconds")
 
     messages = [
-        {
-            "role": "system",
-            "content": f"You are a receptionist for a Dubai based RESTAURANT called The Salusbury. You are on a phone call and therefore the users inputs are coming from a transcription model so take that into account. Respond naturally, concisely and keep your answers conversational as these will be spoken by a text to speech model. Your goal is to take the users request and to try to help them as best you can. Before using check_availability, ensure the user has provided a valid date and time and party size and also let them know that you will check availability and then call the function.\n\nContext: {now}",
-        },
-    ]
-
-    # Tool: function the LLM can call to check availability
-    tools = [
-        {
-            "type": "function",
-            "function": {
-                "name": "check_availability",
-                "description": "Check table availability. Always returns that a table is available.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "date": {
-                            "type": "string",
-                            "description": "Desired date (YYYY-MM-DD)",
-                        },
-                        "time": {
-                            "type": "string",
-                            "description": "Desired time (HH:MM, 24h)",
-                        },
-                        "party_size": {
-                            "type": "integer",
-                            "description": "Number of guests",
-                        },
-                    },
-                    "required": ["date", "time", "party_size"],
-                },
-            },
-        }
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "system", "content": f"Context: {now}"},
     ]
 
     # LLM context and aggregator (manages messages and tool calls)
-    context = OpenAILLMContext(messages, tools=tools, tool_choice="auto")
+    context = OpenAILLMContext(messages, tools=TOOLS, tool_choice="auto")
 
     # Register function handler for tool calls
     async def check_availability(params: FunctionCallParams):
-        await asyncio.sleep(2)
         await params.result_callback({"available": True})
 
     llm.register_function("check_availability", check_availability)
     context_aggregator = llm.create_context_aggregator(context)
 
-    # RTVI: normalize and route frames/events between steps
-    rtvi = RTVIProcessor(config=RTVIConfig(config=[]))
+    # RTVI: normalize and route frames/events between steps (only with metrics enabled)
+    observers = []
+    if _ENABLE_METRICS:
+        rtvi = RTVIProcessor(config=RTVIConfig(config=[]))
+        observers.append(RTVIObserver(rtvi))
 
     pipeline = Pipeline(
         [
@@ -108,16 +114,16 @@ async def run_bot(transport: BaseTransport):
         ]
     )
 
-    # Task: run pipeline with audio settings and metrics enabled
+    # Task: run pipeline with audio settings and optional metrics
     task = PipelineTask(
         pipeline,
         params=PipelineParams(
             audio_in_sample_rate=8000,
             audio_out_sample_rate=8000,
-            enable_metrics=True,
-            enable_usage_metrics=True,
+            enable_metrics=_ENABLE_METRICS,
+            enable_usage_metrics=_ENABLE_METRICS,
         ),
-        observers=[RTVIObserver(rtvi)],
+        observers=observers,
     )
 
     @transport.event_handler("on_client_connected")
@@ -139,34 +145,56 @@ async def run_bot(transport: BaseTransport):
     await runner.run(task)
 
 
+async def _import_transport(module_name: str, name: str):
+    # Import in a worker thread so a first-time load doesn't stall other calls' audio
+    module = await asyncio.to_thread(importlib.import_module, module_name)
+    return getattr(module, name)
+
+
 async def bot(runner_args: RunnerArguments):
     """Main bot entry point compatible with WebRTC and Twilio transports."""
 
     transport = None
 
+    # Transports are imported per branch so each worker only loads the one it uses.
+    # The WebRTC stack (aiortc/av) is heavy, so it is imported off the event loop;
+    # the WebSocket transport and Twilio serializer are light and import inline.
     if isinstance(runner_args, SmallWebRTCRunnerArguments):
+        SmallWebRTCTransport = await _import_transport(
+            "pipecat.transports.smallwebrtc.transport", "SmallWebRTCTransport"
+        )
+
         logger.info("Using WebRTC transport")
         transport = SmallWebRTCTransport(
             params=TransportParams(
                 audio_in_enabled=True,
                 audio_out_enabled=True,
-                vad_analyzer=SileroVADAnalyzer(),
+                vad_analyzer=GatedSileroVADAnalyzer(),
             ),
             webrtc_connection=runner_args.webrtc_connection,
         )
 
     elif isinstance(runner_args, WebSocketRunnerArguments):
+        from pipecat.transports.websocket.fastapi import (
+            FastAPIWebsocketParams,
+            FastAPIWebsocketTransport,
+        )
+
+        from twilio_serializer import FastTwilioFrameSerializer, read_twilio_start
+
         logger.info("Using WebSocket transport (Twilio/Telephony)")
-        # Parse the websocket URL to auto-detect Twilio transport and call data
-        transport_type, call_data = await parse_telephony_websocket(runner_args.websocket)
-        logger.info(f"Auto-detected telephony transport: {transport_type}")
+        # Read Twilio's start message directly; this deployment is Twilio-only
+        start_data = await read_twilio_start(runner_args.websocket)
+        if start_data is None:
+            logger.error("Did not receive a Twilio start message")
+            return
 
         # Twilio serializer: attach call identifiers and credentials
-        serializer = TwilioFrameSerializer(
-            stream_sid=call_data["stream_id"],
-            call_sid=call_data["call_id"],
-            account_sid=os.getenv("TWILIO_ACCOUNT_SID", ""),
-            auth_token=os.getenv("TWILIO_AUTH_TOKEN", ""),
+        serializer = FastTwilioFrameSerializer(
+            stream_sid=start_data["streamSid"],
+            call_sid=start_data.get("callSid"),
+            account_sid=_TWILIO_ACCOUNT_SID,
+            auth_token=_TWILIO_AUTH_TOKEN,
         )
 
         # Transport: FastAPI WebSocket with audio in/out, VAD, and serialization
@@ -176,12 +204,20 @@ async def bot(runner_args: RunnerArguments):
                 audio_in_enabled=True,
                 audio_out_enabled=True,
                 add_wav_header=False,
-                vad_analyzer=SileroVADAnalyzer(),
+                # Send 60ms of audio per Twilio media message instead of 40ms. The
+                # partial chunk left when the bot stops speaking is dropped, so up
+                # to 60ms (was 40ms) of each utterance's tail can be clipped.
+                audio_out_10ms_chunks=6,
+                vad_analyzer=GatedSileroVADAnalyzer(),
                 serializer=serializer,
             ),
         )
 
     elif isinstance(runner_args, DailySessionArguments):
+        SmallWebRTCTransport = await _import_transport(
+            "pipecat.transports.smallwebrtc.transport", "SmallWebRTCTransport"
+        )
+
         logger.info("Using Daily.co session transport")
         # For Daily.co sessions, we can use the same WebRTC transport
         # but with Daily-specific connection handling
@@ -189,7 +225,7 @@ async def bot(runner_args: RunnerArguments):
             params=TransportParams(
                 audio_in_enabled=True,
                 audio_out_enabled=True,
-                vad_analyzer=SileroVADAnalyzer(),
+                vad_analyzer=GatedSileroVADAnalyzer(),
             ),
             webrtc_connection=runner_args.webrtc_connection,
         )
@@ -209,5 +245,13 @@ async def bot(runner_args: RunnerArguments):
 if __name__ == "__main__":
     from pipecat.runner.run import main
 
+    # Event loop: prefer libuv-backed uvloop for the WebSocket audio path
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        logger.warning("uvloop not installed, using the default asyncio event loop")
+
     # CLI entrypoint
     main()
\ No newline at end of file
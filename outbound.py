@@ -1,10 +1,29 @@
 import os
+import re
 import sys
 import argparse
+import functools
 
 from dotenv import load_dotenv
 from twilio.rest import Client
 
+_SCHEME_RE = re.compile(r"^https?://")
+
+
+@functools.lru_cache(maxsize=None)
+def get_client(account_sid: str, auth_token: str) -> Client:
+    # Reuse the client (and its HTTP session) when placing several calls
+    return Client(account_sid, auth_token)
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_proxy() -> str | None:
+    return (
+        os.getenv("PIPECAT_PROXY_HOST")
+        or os.getenv("PROXY_HOST")
+        or os.getenv("NGROK_HOST")
+    )
+
 
 def build_twiml_url(proxy: str | None, explicit_url: str | None) -> str:
     if explicit_url:
@@ -12,11 +31,7 @@ def build_twiml_url(proxy: str | None, explicit_url: str | None) -> str:
 
     # Allow reading from env if not provided via CLI
     if not proxy:
-        proxy = (
-            os.getenv("PIPECAT_PROXY_HOST")
-            or os.getenv("PROXY_HOST")
-            or os.getenv("NGROK_HOST")
-        )
+        proxy = _resolve_proxy()
 
     if not proxy:
         print(
@@ -26,7 +41,7 @@ def build_twiml_url(proxy: str | None, explicit_url: str | None) -> str:
         sys.exit(2)
 
     # Ensure we only pass the host (run.py expects hostname, not protocol)
-    proxy = proxy.replace("http://", "").replace("https://", "").rstrip("/")
+    proxy = _SCHEME_RE.sub("", proxy).rstrip("/")
     return f"https://{proxy}/"
 
 
@@ -60,7 +75,7 @@ def main():
 
     twiml_url = build_twiml_url(args.proxy, args.url)
 
-    client = Client(account_sid, auth_token)
+    client = get_client(account_sid, auth_token)
     call = client.calls.create(
         to=args.to,
         from_=args.from_,
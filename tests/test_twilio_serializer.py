@@ -0,0 +1,131 @@
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("pipecat.serializers.twilio")
+
+from fastapi import WebSocket
+from pipecat.frames.frames import (
+    OutputAudioRawFrame,
+    StartFrame,
+    StartInterruptionFrame,
+    TransportMessageUrgentFrame,
+)
+from pipecat.serializers.twilio import TwilioFrameSerializer
+
+from twilio_serializer import FastTwilioFrameSerializer, read_twilio_start
+
+CONNECTED = json.dumps({"event": "connected", "protocol": "Call", "version": "1.0.0"})
+START = {
+    "streamSid": "MZ0123456789abcdef0123456789abcdef",
+    "callSid": "CA0123456789abcdef0123456789abcdef",
+    "accountSid": "AC0123456789abcdef0123456789abcdef",
+    "customParameters": {},
+}
+
+# Characters that must be escaped inside a JSON string
+STREAM_SID = 'MZ"quoted"\\back\\slash'
+
+
+def _serializer_pair():
+    """Return a set-up stock and fast serializer for the same stream."""
+
+    async def setup(serializer):
+        await serializer.setup(StartFrame(audio_in_sample_rate=8000, audio_out_sample_rate=8000))
+        return serializer
+
+    kwargs = dict(stream_sid=STREAM_SID, call_sid="CA123", account_sid="AC123", auth_token="token")
+    stock = asyncio.run(setup(TwilioFrameSerializer(**kwargs)))
+    fast = asyncio.run(setup(FastTwilioFrameSerializer(**kwargs)))
+    return stock, fast
+
+
+@pytest.mark.parametrize(
+    "frame",
+    [
+        OutputAudioRawFrame(audio=bytes(range(256)) * 2, sample_rate=8000, num_channels=1),
+        StartInterruptionFrame(),
+        TransportMessageUrgentFrame(message={"event": "mark", "streamSid": STREAM_SID}),
+    ],
+    ids=["audio", "interruption", "transport-message"],
+)
+def test_serialize_matches_stock_serializer(frame):
+    stock, fast = _serializer_pair()
+
+    expected = asyncio.run(stock.serialize(frame))
+    actual = asyncio.run(fast.serialize(frame))
+
+    assert json.loads(actual) == json.loads(expected)
+
+
+MEDIA = json.dumps({"event": "media", "streamSid": STREAM_SID, "media": {"payload": "f/9/f39/"}})
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        MEDIA,
+        MEDIA.encode(),
+        json.dumps({"event": "dtmf", "streamSid": STREAM_SID, "dtmf": {"digit": "5"}}),
+        json.dumps({"event": "stop", "streamSid": STREAM_SID}),
+    ],
+    ids=["media-str", "media-bytes", "dtmf", "stop"],
+)
+def test_deserialize_matches_stock_serializer(data):
+    stock, fast = _serializer_pair()
+
+    expected = asyncio.run(stock.deserialize(data))
+    actual = asyncio.run(fast.deserialize(data))
+
+    assert type(actual) is type(expected)
+    if expected is not None:
+        for field in ("audio", "sample_rate", "num_channels", "button"):
+            assert getattr(actual, field, None) == getattr(expected, field, None)
+
+
+def _read_start(*texts):
+    """Run read_twilio_start on a socket that sends ``texts`` and disconnects."""
+    messages = [{"type": "websocket.connect"}]
+    messages += [{"type": "websocket.receive", "text": text} for text in texts]
+    messages.append({"type": "websocket.disconnect", "code": 1000})
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        pass
+
+    async def run():
+        websocket = WebSocket({"type": "websocket"}, receive, send)
+        await websocket.accept()
+        return await read_twilio_start(websocket)
+
+    return asyncio.run(run())
+
+
+def test_read_twilio_start_returns_start_payload():
+    start = json.dumps({"event": "start", "sequenceNumber": "1", "start": START})
+    assert _read_start(CONNECTED, start) == START
+
+
+def test_read_twilio_start_rejects_invalid_json():
+    assert _read_start("not json") is None
+
+
+def test_read_twilio_start_stops_after_handshake():
+    stop = json.dumps({"event": "stop"})
+    start = json.dumps({"event": "start", "start": START})
+    assert _read_start(CONNECTED, stop, start) is None
+
+
+def test_read_twilio_start_handles_disconnect():
+    assert _read_start(CONNECTED) is None
+
+
+@pytest.mark.parametrize("start", [None, "MZ123", {"callSid": START["callSid"]}])
+def test_read_twilio_start_rejects_malformed_start(start):
+    message = {"event": "start"}
+    if start is not None:
+        message["start"] = start
+    assert _read_start(CONNECTED, json.dumps(message)) is None
@@ -0,0 +1,140 @@
+import types
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pipecat.audio.vad.silero")
+
+from pipecat.audio.vad.silero import SileroVADAnalyzer
+from pipecat.audio.vad.vad_analyzer import VADState
+
+import vad
+from vad import GatedSileroVADAnalyzer, SharedSileroVADAnalyzer
+
+SAMPLE_RATE = 8000
+
+
+def _window(analyzer, rms: float, rng) -> bytes:
+    samples = rng.normal(0.0, rms, analyzer.num_frames_required())
+    return np.clip(samples, -32768, 32767).astype(np.int16).tobytes()
+
+
+def _windows(analyzer, rms: float, seconds: float, rng):
+    for _ in range(int(seconds * SAMPLE_RATE / analyzer.num_frames_required())):
+        yield _window(analyzer, rms, rng)
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(0)
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    # Skip the ONNX model: count the windows and resets that reach Silero instead
+    resets = []
+    model = types.SimpleNamespace(reset_states=lambda: resets.append(True))
+    monkeypatch.setattr(vad, "load_silero_model", lambda: model)
+    calls = []
+
+    def fake_voice_confidence(self, buffer):
+        calls.append(buffer)
+        return self.model_confidence
+
+    monkeypatch.setattr(SileroVADAnalyzer, "voice_confidence", fake_voice_confidence)
+
+    analyzer = GatedSileroVADAnalyzer()
+    analyzer.set_sample_rate(SAMPLE_RATE)
+    analyzer.model_confidence = 0.0
+    analyzer.model_calls = calls
+    analyzer.model_resets = resets
+    return analyzer
+
+
+def test_loud_noise_does_not_gate_later_speech(analyzer, rng):
+    # 10s of loud non-speech that the model scores as silence
+    for window in _windows(analyzer, 1500, 10, rng):
+        analyzer.analyze_audio(window)
+
+    # A quieter talker that is still well above min_volume must reach the model
+    analyzer.model_calls.clear()
+    speech = list(_windows(analyzer, 1000, 10, rng))
+    for window in speech:
+        analyzer.analyze_audio(window)
+
+    assert len(analyzer.model_calls) == len(speech)
+
+
+def test_quiet_windows_are_not_gated_once_speech_starts(analyzer, rng):
+    analyzer.model_confidence = 1.0
+    analyzer._noise_floor = 40.0
+    ungated = SharedSileroVADAnalyzer()
+    ungated.set_sample_rate(SAMPLE_RATE)
+    ungated.model_confidence = 1.0
+
+    # The RMS 50 windows sit under the gate cap but follow loud speech, so the
+    # smoothed volume keeps them above min_volume
+    levels = [3000] * 6 + [50] * 2 + [3000] + [50] * 4
+    windows = [_window(analyzer, rms, rng) for rms in levels]
+    expected = [ungated.analyze_audio(window) for window in windows]
+    states = [analyzer.analyze_audio(window) for window in windows]
+
+    assert states == expected
+    assert states[-1] == VADState.SPEAKING
+
+
+def test_silence_is_gated(analyzer, rng):
+    for window in _windows(analyzer, 5, 2, rng):
+        assert analyzer.analyze_audio(window) == VADState.QUIET
+
+    assert not analyzer.model_calls
+
+
+def test_noise_floor_adapts_between_minimum_and_cap(analyzer, rng):
+    # Line noise above the minimum gate is scored silent and raises the floor
+    for window in _windows(analyzer, 50, 10, rng):
+        analyzer.analyze_audio(window)
+    assert 20 < analyzer._noise_floor < 30
+
+    # ...so the gate now covers noise it let through at the minimum floor
+    analyzer.model_calls.clear()
+    for window in _windows(analyzer, 35, 1, rng):
+        analyzer.analyze_audio(window)
+    assert not analyzer.model_calls
+
+    # Gated windows above the floor never raise it
+    floor = analyzer._noise_floor
+    for window in _windows(analyzer, 40, 2, rng):
+        analyzer.analyze_audio(window)
+    assert analyzer._noise_floor == floor
+
+    # Gated windows below the floor lower it
+    for window in _windows(analyzer, 12, 2, rng):
+        analyzer.analyze_audio(window)
+    assert analyzer._noise_floor < floor
+
+
+def test_noise_floor_gate_is_capped(analyzer, rng):
+    # Loud noise scored silent raises the floor, but the gate stays at the cap
+    for window in _windows(analyzer, 1500, 10, rng):
+        analyzer.analyze_audio(window)
+    assert analyzer._noise_floor > 1000
+
+    for window in _windows(analyzer, 5, 2, rng):
+        analyzer.analyze_audio(window)
+    analyzer.model_calls.clear()
+    above_cap = list(_windows(analyzer, analyzer._max_gate_energy * 2, 1, rng))
+    for window in above_cap:
+        analyzer.analyze_audio(window)
+    assert len(analyzer.model_calls) == len(above_cap)
+
+
+def test_model_resets_after_a_second_of_gated_windows(analyzer, rng):
+    resets = len(analyzer.model_resets)
+
+    for _ in range(analyzer._reset_after_frames - 1):
+        analyzer.analyze_audio(_window(analyzer, 5, rng))
+    assert len(analyzer.model_resets) == resets
+
+    analyzer.analyze_audio(_window(analyzer, 5, rng))
+    assert len(analyzer.model_resets) == resets + 1
@@ -0,0 +1,94 @@
+import orjson
+import pybase64
+from fastapi import WebSocket
+from loguru import logger
+
+from pipecat.audio.utils import pcm_to_ulaw, ulaw_to_pcm
+from pipecat.frames.frames import (
+    AudioRawFrame,
+    Frame,
+    InputAudioRawFrame,
+    StartInterruptionFrame,
+)
+from pipecat.serializers.twilio import TwilioFrameSerializer
+
+
+class FastTwilioFrameSerializer(TwilioFrameSerializer):
+    """Twilio serializer with a fast path for media messages.
+
+    Media messages arrive and leave every 20ms per call, so only that path is
+    specialized: JSON goes through orjson, base64 through pybase64's SIMD
+    codec, and outbound media messages are built from a prefix precomputed for
+    the stream. Everything else (hang up, DTMF, transport messages) is
+    delegated to TwilioFrameSerializer.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Static head of every outbound media message; only the payload varies
+        stream_sid = orjson.dumps(self._stream_sid).decode()
+        self._media_prefix = f'{{"event":"media","streamSid":{stream_sid},"media":{{"payload":"'
+
+    async def serialize(self, frame: Frame) -> str | bytes | None:
+        if isinstance(frame, StartInterruptionFrame):
+            return orjson.dumps({"event": "clear", "streamSid": self._stream_sid}).decode()
+
+        if isinstance(frame, AudioRawFrame):
+            # Output: convert PCM at the frame's rate to 8kHz μ-law for Twilio
+            serialized_data = await pcm_to_ulaw(
+                frame.audio, frame.sample_rate, self._twilio_sample_rate, self._output_resampler
+            )
+            if not serialized_data:
+                return None
+
+            payload = pybase64.b64encode_as_string(serialized_data)
+            return f'{self._media_prefix}{payload}"}}}}'
+
+        return await super().serialize(frame)
+
+    async def deserialize(self, data: str | bytes) -> Frame | None:
+        message = orjson.loads(data)
+
+        if message.get("event") != "media":
+            return await super().deserialize(data)
+
+        # Input: convert 8kHz μ-law from Twilio to PCM at the pipeline rate
+        payload = pybase64.b64decode(message["media"]["payload"])
+        deserialized_data = await ulaw_to_pcm(
+            payload, self._twilio_sample_rate, self._sample_rate, self._input_resampler
+        )
+        if not deserialized_data:
+            return None
+
+        return InputAudioRawFrame(
+            audio=deserialized_data, num_channels=1, sample_rate=self._sample_rate
+        )
+
+
+async def read_twilio_start(websocket: WebSocket) -> dict | None:
+    """Consume Twilio's stream handshake and return the ``start`` payload.
+
+    Twilio sends a ``connected`` message followed by ``start``, which carries
+    the stream and call SIDs. Returns None if the socket closes, a message is
+    not valid JSON, neither of the two handshake messages is ``start``, or the
+    ``start`` payload has no stream SID.
+    """
+    received = 0
+    async for raw in websocket.iter_text():
+        try:
+            message = orjson.loads(raw)
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Invalid JSON in Twilio handshake: {e}")
+            return None
+
+        if isinstance(message, dict) and message.get("event") == "start":
+            start = message.get("start")
+            if not isinstance(start, dict) or not start.get("streamSid"):
+                logger.error(f"Twilio start message without a stream SID: {message}")
+                return None
+            return start
+
+        received += 1
+        if received == 2:
+            break
+    return None
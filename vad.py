@@ -0,0 +1,120 @@
+import copy
+import functools
+from importlib.resources import files
+from typing import Optional
+
+import numpy as np
+from loguru import logger
+
+from pipecat.audio.vad.silero import SileroOnnxModel, SileroVADAnalyzer
+from pipecat.audio.vad.vad_analyzer import VADAnalyzer, VADParams, VADState
+
+# Lowest noise floor (int16 RMS, about -70 dBFS) so digital silence still gates
+_MIN_NOISE_FLOOR = 10.0
+
+
+def _min_volume_rms(min_volume: float) -> float:
+    """Return an int16 RMS below which a window scores under ``min_volume``.
+
+    Pipecat maps loudness (LUFS over int16 samples) from [-20, 80] onto the
+    [0, 1] volume scale. K-weighting can add up to about 4 dB for
+    high-frequency content, so the result is lowered by 5 dB to stay below
+    the RMS of any window that would reach ``min_volume`` on its own.
+    """
+    loudness = -20.0 + 100.0 * min_volume
+    return 10 ** ((loudness + 0.691 - 5.0) / 20)
+
+
+@functools.lru_cache(maxsize=1)
+def load_silero_model() -> SileroOnnxModel:
+    logger.debug("Loading shared Silero VAD model...")
+    model_path = str(files("pipecat.audio.vad.data").joinpath("silero_vad.onnx"))
+    model = SileroOnnxModel(model_path, force_onnx_cpu=True)
+    logger.debug("Loaded shared Silero VAD")
+    return model
+
+
+class SharedSileroVADAnalyzer(SileroVADAnalyzer):
+    """Silero VAD analyzer that loads the ONNX model once per process.
+
+    The inference session is shared between calls, but each analyzer keeps
+    its own recurrent state, so create one analyzer per call as usual.
+    """
+
+    def __init__(self, *, sample_rate: Optional[int] = None, params: Optional[VADParams] = None):
+        VADAnalyzer.__init__(self, sample_rate=sample_rate, params=params)
+
+        self._model = copy.copy(load_silero_model())
+        self._model.reset_states()
+        self._last_reset_time = 0
+
+
+class GatedSileroVADAnalyzer(SharedSileroVADAnalyzer):
+    """Silero VAD analyzer that skips inference on frames below the noise floor.
+
+    While the analyzer is quiet, each frame's RMS energy is checked first and
+    only frames louder than ``gate_ratio`` times an adaptive noise floor reach
+    the model. The gate is capped below the energy matching
+    ``params.min_volume``, and it is only applied while the previous smoothed
+    volume is also under ``min_volume``, so a gated frame's smoothed volume
+    cannot reach the speaking threshold. Once speech is starting or ongoing
+    every frame reaches the model. The floor is an exponential moving average
+    over frames judged silent while quiet; gated frames may only lower it.
+    Long gated runs reset the model's recurrent state.
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_rate: Optional[int] = None,
+        params: Optional[VADParams] = None,
+        gate_ratio: float = 2.0,
+        noise_floor_alpha: float = 0.01,
+    ):
+        self._gate_ratio = gate_ratio
+        self._noise_floor_alpha = noise_floor_alpha
+        self._noise_floor = _MIN_NOISE_FLOOR
+        self._max_gate_energy = 0.0
+        self._skipped_frames = 0
+        self._reset_after_frames = 0
+
+        super().__init__(sample_rate=sample_rate, params=params)
+
+    def set_sample_rate(self, sample_rate: int):
+        super().set_sample_rate(sample_rate)
+        # Reset the model after one second of gated frames
+        self._reset_after_frames = max(1, self.sample_rate // self.num_frames_required())
+
+    def set_params(self, params: VADParams):
+        super().set_params(params)
+        self._max_gate_energy = _min_volume_rms(params.min_volume)
+
+    def voice_confidence(self, buffer) -> float:
+        samples = np.frombuffer(buffer, dtype=np.int16).astype(np.float32)
+        energy = float(np.sqrt(np.mean(samples * samples)))
+
+        # Only gate or learn the floor from confirmed silence, never mid-utterance
+        quiet = self._vad_state == VADState.QUIET
+        threshold = min(
+            max(self._noise_floor, _MIN_NOISE_FLOOR) * self._gate_ratio, self._max_gate_energy
+        )
+
+        # The base analyzer smooths volume across frames, so a quiet frame can
+        # still count as speech right after a loud one
+        if quiet and self._prev_volume < self._params.min_volume and energy < threshold:
+            # Gated frames can pull the floor down but never hold it up
+            if energy < self._noise_floor:
+                self._update_noise_floor(energy)
+            self._skipped_frames += 1
+            if self._skipped_frames == self._reset_after_frames:
+                self._model.reset_states()
+            return 0.0
+
+        self._skipped_frames = 0
+        confidence = super().voice_confidence(buffer)
+        if quiet and confidence < self._params.confidence:
+            self._update_noise_floor(energy)
+        return confidence
+
+    def _update_noise_floor(self, energy: float):
+        self._noise_floor += self._noise_floor_alpha * (energy - self._noise_floor)